@@ -0,0 +1,141 @@
+"""_bencode.py – .torrent size extraction shared by the debugging scripts.
+
+Only info.length / info.files[*].length are needed, so instead of decoding the whole
+metainfo into Python objects (including the multi-KB `pieces` blob) this walks the
+raw bytes, jumps straight over every value it doesn't care about and only
+materialises dict keys and the length integers.
+
+The size fields sit near the start of the `info` dict (keys are sorted, and
+`files` / `length` come before `pieces`), so `size_from_chunks` can usually stop
+reading a streamed download after the first chunk.
+"""
+from typing import Iterable, Optional
+
+_D, _L, _I, _E = b"dlie"
+
+
+class NeedMore(Exception):
+    """Raised by try_parse_size when the buffer ends before the size fields."""
+
+
+def _index(data: bytes, sub: bytes, idx: int) -> int:
+    pos = data.find(sub, idx)
+    if pos < 0:
+        raise NeedMore
+    return pos
+
+
+def _string_bounds(data: bytes, idx: int):
+    """Return (start, end) of the byte string whose `<length>:` prefix starts at `idx`."""
+    if not 48 <= data[idx] <= 57:  # ASCII digit
+        raise ValueError(f"unexpected token at {idx}: {data[idx:idx + 1]!r}")
+    colon = _index(data, b":", idx)
+    start = colon + 1
+    end = start + int(data[idx:colon])
+    if end < start:
+        raise ValueError(f"bad string length at {idx}")
+    return start, end
+
+
+def _skip(data: bytes, idx: int) -> int:
+    """Return the offset just past the bencoded value starting at `idx`."""
+    depth = 0
+    while True:
+        token = data[idx]
+        if token == _D or token == _L:
+            depth += 1
+            idx += 1
+        elif token == _E:
+            depth -= 1
+            idx += 1
+            if depth < 0:
+                raise ValueError(f"unexpected end marker at {idx - 1}")
+        elif token == _I:
+            idx = _index(data, b"e", idx) + 1
+        else:
+            idx = _string_bounds(data, idx)[1]
+        if depth == 0:
+            if idx > len(data):
+                raise NeedMore
+            return idx
+
+
+def _read_key(data: bytes, idx: int):
+    start, end = _string_bounds(data, idx)
+    if end > len(data):
+        raise NeedMore
+    return data[start:end], end
+
+
+def _find_key(data: bytes, idx: int, wanted: bytes) -> Optional[int]:
+    """Return the offset of `wanted`'s value in the dict starting at `idx`, if present."""
+    if data[idx] != _D:
+        return None
+    idx += 1
+    while data[idx] != _E:
+        key, idx = _read_key(data, idx)
+        if key == wanted:
+            return idx
+        idx = _skip(data, idx)
+    return None
+
+
+def _read_int(data: bytes, idx: int) -> Optional[int]:
+    if data[idx] != _I:
+        return None
+    end = _index(data, b"e", idx)
+    return int(data[idx + 1:end])
+
+
+def _sum_files(data: bytes, idx: int) -> Optional[int]:
+    if data[idx] != _L:
+        return None
+    total = 0
+    idx += 1
+    while data[idx] != _E:
+        at = _find_key(data, idx, b"length")
+        if at is not None:
+            total += _read_int(data, at) or 0
+        idx = _skip(data, idx)
+    return total if total > 0 else None
+
+
+def try_parse_size(data: bytes) -> Optional[int]:
+    """Return the total content size, None if absent/malformed; NeedMore if `data` is cut short."""
+    try:
+        info = _find_key(data, 0, b"info")
+        if info is None or data[info] != _D:
+            return None
+        idx = info + 1
+        while data[idx] != _E:
+            key, idx = _read_key(data, idx)
+            if key == b"length":
+                return _read_int(data, idx)
+            if key == b"files":
+                return _sum_files(data, idx)
+            idx = _skip(data, idx)
+        return None
+    except IndexError:
+        raise NeedMore from None
+    except ValueError:
+        return None
+
+
+def torrent_total_length(data: bytes) -> Optional[int]:
+    """Return the total content size declared in a complete .torrent, or None."""
+    try:
+        return try_parse_size(data)
+    except NeedMore:
+        return None
+
+
+def size_from_chunks(chunks: Iterable[bytes]) -> Optional[int]:
+    """Parse the size from a streamed .torrent, returning as soon as it is known."""
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        try:
+            return try_parse_size(buf)
+        except NeedMore:
+            continue
+    return None
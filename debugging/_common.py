@@ -0,0 +1,65 @@
+"""_common.py – feed-entry helpers and logging setup shared by the debugging scripts."""
+import logging
+import re
+import sys
+from pathlib import Path
+from typing import Optional
+
+# ".torrent" at the end of the path, optionally followed by a query string or fragment
+_TORRENT_RE = re.compile(r"\.torrent(?:$|[?#])")
+
+
+def setup_logger(name: str, log_file: Optional[str] = None) -> logging.Logger:
+    """Return logger `name` writing to stdout (and `log_file`), configured only once."""
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    if logger.handlers:  # re-imports (e.g. run_all.py) must not duplicate output
+        return logger
+    fmt = logging.Formatter("%(asctime)s %(levelname)s: %(message)s")
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(fmt)
+        logger.addHandler(handler)
+    return logger
+
+
+def get_guid(entry) -> Optional[str]:
+    return entry.get("id") or entry.get("guid") or entry.get("link")
+
+
+def extract_torrent_size(entry) -> Optional[int]:
+    """Return content size in bytes, if present in feed entry."""
+    # Unrolled: this runs for every polled entry, and most feeds carry the top-level key
+    raw = entry.get("contentlength")
+    if raw is not None:
+        try:
+            return int(raw)
+        except (TypeError, ValueError):
+            pass
+    torrent = entry.get("torrent")
+    if torrent:
+        raw = torrent.get("contentlength")
+        if raw is not None:
+            try:
+                return int(raw)
+            except (TypeError, ValueError):
+                pass
+    return None
+
+
+def get_torrent_url(entry) -> Optional[str]:
+    # Prefer enclosures
+    for enc in entry.get("enclosures", []):
+        href = enc.get("href")
+        if href and _TORRENT_RE.search(href):
+            return href
+    # Then typed links
+    for link in entry.get("links", []):
+        if link.get("type") in ("application/x-bittorrent", "application/octet-stream"):
+            return link.get("href")
+    # Fallback to the main link if it looks like a torrent link
+    link = entry.get("link")
+    return link if link and _TORRENT_RE.search(link) else None
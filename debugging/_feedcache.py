@@ -0,0 +1,192 @@
+"""_feedcache.py – on-disk RSS / torrent cache shared by the debugging scripts.
+
+Running several debug scripts back-to-back would otherwise download and parse the
+same feed every time. `get_feed` keeps the raw XML under ~/.cache/ratioking/ and
+reuses it for `ttl` seconds; once stale, it revalidates with a conditional GET and
+only rewrites the cached body when the server actually sends a new one.
+
+Torrent sizes are remembered alongside the ETag / Last-Modified of the .torrent,
+so an unchanged file can be confirmed with a HEAD instead of downloaded again.
+"""
+import base64
+import email.utils
+import functools
+import hashlib
+import io
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from datetime import timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import feedparser
+import requests
+
+from _http import SESSION
+
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", str(Path.home() / ".cache"))) / "ratioking"
+TORRENT_CACHE = CACHE_DIR / "torrents.json"
+HTTP_TIMEOUT = 30
+
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+
+def _load(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _store(path: Path, entry: Dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(entry))
+    tmp.replace(path)
+
+
+def _validator_headers(etag: Optional[str], modified: Optional[str]) -> Dict[str, str]:
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+    return headers
+
+
+def conditional_get(url: str, etag: Optional[str] = None, modified: Optional[str] = None) -> requests.Response:
+    """GET `url`, sending If-None-Match / If-Modified-Since when validators are known."""
+    return SESSION.get(url, headers=_validator_headers(etag, modified), timeout=HTTP_TIMEOUT)
+
+
+def get_feed_bytes(url: str, ttl: int = 60) -> bytes:
+    """Return the raw feed XML, served from the disk cache while younger than `ttl` seconds.
+
+    Raises requests.RequestException if the feed can't be fetched.
+    """
+    path = _cache_path(url)
+    cached = _load(path)
+    now = time.time()
+    if cached and now - cached["fetched_at"] < ttl:
+        return base64.b64decode(cached["raw_xml"])
+
+    resp = conditional_get(url, cached and cached.get("etag"), cached and cached.get("modified"))
+    if resp.status_code == 304 and cached:
+        cached["fetched_at"] = now
+        _store(path, cached)
+        return base64.b64decode(cached["raw_xml"])
+    resp.raise_for_status()
+    _store(path, {
+        "fetched_at": now,
+        "etag": resp.headers.get("ETag"),
+        "modified": resp.headers.get("Last-Modified"),
+        "raw_xml": base64.b64encode(resp.content).decode("ascii"),
+    })
+    return resp.content
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_cached(url: str, ttl: int, bucket: int):
+    # `bucket` only exists to expire entries; fetch errors propagate and are not cached
+    return feedparser.parse(get_feed_bytes(url, ttl))
+
+
+def get_feed(url: str, ttl: int = 60):
+    """Return the parsed feed (see get_feed_bytes); fetch errors yield an empty bozo feed.
+
+    Within one process the parsed result is reused for the current `ttl` window, so
+    run_all.py's workers share a single parse. Treat it as read-only.
+    """
+    try:
+        return _parse_cached(url, ttl, int(time.time() // max(ttl, 1)))
+    except requests.RequestException as exc:
+        return feedparser.FeedParserDict(bozo=1, bozo_exception=exc, entries=[], feed={})
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+def _first_rss_item(raw: bytes) -> Optional[Dict[str, Any]]:
+    """Stream-parse RSS 2.0 up to the first <item> and map it to feedparser's entry keys."""
+    for _, elem in ET.iterparse(io.BytesIO(raw), events=("end",)):
+        if elem.tag != "item":
+            continue
+        entry: Dict[str, Any] = {"enclosures": [], "links": []}
+        for child in elem:
+            name = _local_name(child.tag)
+            text = (child.text or "").strip()
+            if name == "title":
+                entry["title"] = text
+            elif name == "guid":
+                entry["id"] = entry["guid"] = text
+            elif name == "link" and text:
+                entry["link"] = text
+            elif name == "pubdate" and text:
+                entry["published"] = text
+            elif name == "enclosure":
+                enc = {"href": child.get("url"), "length": child.get("length"), "type": child.get("type")}
+                entry["enclosures"].append(enc)
+                entry["links"].append({"rel": "enclosure", **enc})
+        for child in elem.iter():
+            if _local_name(child.tag) == "contentlength" and child.text:
+                entry["contentlength"] = child.text.strip()
+                break
+        elem.clear()
+
+        try:
+            published = email.utils.parsedate_to_datetime(entry["published"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        entry["published_parsed"] = published.utctimetuple()
+        return entry
+    return None
+
+
+def first_entry(raw: bytes):
+    """Return the newest entry of the feed XML `raw`, or None if it has none.
+
+    RSS 2.0 takes a fast path that stops parsing at the first <item> instead of
+    building every entry; anything else (Atom, malformed XML, an item without a
+    usable pubDate) falls back to a full feedparser parse.
+    """
+    try:
+        entry = _first_rss_item(raw)
+    except ET.ParseError:
+        entry = None
+    if entry is not None:
+        return entry
+    feed = feedparser.parse(raw)
+    return feed.entries[0] if feed.entries else None
+
+
+def cached_torrent_size(url: str) -> Optional[int]:
+    """Return the remembered size of `url` if a HEAD confirms the .torrent is unchanged."""
+    meta = (_load(TORRENT_CACHE) or {}).get(url)
+    if not meta or meta.get("size_bytes") is None:
+        return None
+    headers = _validator_headers(meta.get("etag"), meta.get("modified"))
+    if not headers:
+        return None
+    try:
+        head = SESSION.head(url, headers=headers, timeout=10, allow_redirects=True)
+    except requests.RequestException:
+        return None
+    return meta["size_bytes"] if head.status_code == 304 else None
+
+
+def remember_torrent(url: str, resp: requests.Response, size_bytes: Optional[int]):
+    """Store the validators of a fetched .torrent together with its parsed size."""
+    etag = resp.headers.get("ETag")
+    modified = resp.headers.get("Last-Modified")
+    if size_bytes is None or not (etag or modified):
+        return
+    cache = _load(TORRENT_CACHE) or {}
+    cache[url] = {"etag": etag, "modified": modified, "size_bytes": size_bytes}
+    _store(TORRENT_CACHE, cache)
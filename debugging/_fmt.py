@@ -0,0 +1,47 @@
+"""_fmt.py – message formatting helpers shared by the debugging scripts."""
+import html
+import json
+import re
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+_HTML_SPECIAL = re.compile(r"[<>&\"']")
+
+
+def human_bytes(n: int) -> str:
+    """Format a byte count with a binary unit, e.g. 1288490188 -> "1.20 GB"."""
+    if n <= 0:
+        return "0 B"
+    # bit_length picks the 1024-power directly instead of dividing in a loop
+    k = min((n.bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{n / (1 << (10 * k)):.2f} {_UNITS[k]}"
+
+
+def maybe_escape(text: str) -> str:
+    """html.escape `text`, returning it untouched when it has nothing to escape."""
+    return html.escape(text) if _HTML_SPECIAL.search(text) else text
+
+
+def _orjson_default(obj):
+    # stdlib json writes tuple subclasses such as time.struct_time as lists; keep that
+    return list(obj) if isinstance(obj, tuple) else str(obj)
+
+
+def dump_json(obj):
+    """Pretty-print `obj` as JSON to stdout, via orjson when it is installed."""
+    if orjson is None:
+        print(json.dumps(obj, indent=2, default=str))
+        return
+    data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+                        default=_orjson_default)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # e.g. run_all.py's per-thread text capture
+        sys.stdout.write(data.decode())
+    else:
+        sys.stdout.flush()
+        buffer.write(data)
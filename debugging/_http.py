@@ -0,0 +1,24 @@
+"""_http.py – pooled, retrying HTTP session shared by the debugging scripts.
+
+Reusing one Session keeps TCP/TLS connections to the feed, tracker, qBittorrent and
+Telegram alive between calls instead of handshaking for every request.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+SESSION = requests.Session()
+# urllib3 only advertises br/zstd when it can decode them (brotli / zstandard installed)
+SESSION.headers.update(make_headers(accept_encoding=True))
+
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    # raise_on_status=False hands the final 5xx response back to the caller. 429/503 come
+    # straight back too: their Retry-After is for the caller to honour, not for urllib3 to
+    # sleep through (uninterruptibly) and then hit the server again.
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 504],
+                      raise_on_status=False, respect_retry_after_header=False),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
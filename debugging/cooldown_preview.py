@@ -7,8 +7,12 @@ Falls back to the legacy 2-hour cooldown if the size is unavailable or speed is
 import math
 import os
 import sys
+import requests
 from dotenv import load_dotenv
-import feedparser
+
+from _common import extract_torrent_size, get_guid
+from _feedcache import first_entry, get_feed_bytes
+from _fmt import human_bytes
 
 load_dotenv()
 
@@ -22,42 +26,20 @@ if not RSS_URL:
     sys.exit(1)
 
 
-def extract_torrent_size(entry):
-    """Return content size in bytes, if present in feed entry."""
-    candidates = [
-        entry.get("contentlength"),
-        entry.get("torrent", {}).get("contentlength") if entry.get("torrent") else None,
-    ]
-    for raw in candidates:
-        if raw is None:
-            continue
-        try:
-            return int(raw)
-        except (TypeError, ValueError):
-            continue
-    return None
-
-
-def human_bytes(num):
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(num) < 1024:
-            return f"{num:.2f} {unit}"
-        num /= 1024
-    return f"{num:.2f} PB"
-
-
 def main():
-    feed = feedparser.parse(RSS_URL)
-    if not feed.entries:
+    try:
+        entry = first_entry(get_feed_bytes(RSS_URL))
+    except requests.RequestException:
+        entry = None
+    if entry is None:
         print("⚠️ RSS feed empty or unreachable")
         sys.exit(2)
 
-    entry = feed.entries[0]
     title = entry.get("title", "<no title>")
     size_bytes = extract_torrent_size(entry)
 
     print(f"Latest item: {title}")
-    print(f"GUID: {entry.get('id') or entry.get('guid') or entry.get('link')}")
+    print(f"GUID: {get_guid(entry)}")
 
     if size_bytes:
         cooldown_seconds = math.ceil(size_bytes / SPEED_BYTES_PER_SEC) if SPEED_BYTES_PER_SEC > 0 else DEFAULT_COOLDOWN
@@ -1,19 +1,22 @@
 #!/usr/bin/env python3
 """ratiotest.py – simulation script with three rules
 
-Time handling fix: convert RSS published/updated times to **UTC** using
-`calendar.timegm`, because `feedparser` already normalises the tz offset to
-UTC but `time.mktime` mistakenly treats it as local time. This removes the
-~2‑hour skew you observed.
+Time handling fix: convert RSS published/updated times to a **UTC** epoch,
+because `feedparser` already normalises the tz offset to UTC but `time.mktime`
+mistakenly treats it as local time. This removes the ~2‑hour skew you observed.
 """
 import os
 import sys
 import json
 import time
-import logging
-import calendar
+import functools
 import math
-from urllib.parse import urlparse
+import random
+import re
+import signal
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -23,9 +26,13 @@ try:
 except ImportError:
     pass
 
-import feedparser
 import requests
 
+from _bencode import torrent_total_length
+from _common import extract_torrent_size, get_guid, get_torrent_url, setup_logger
+from _feedcache import conditional_get, first_entry
+from _http import SESSION
+
 # ─── CONFIG ────────────────────────────────────────────────
 QB_URL       = os.getenv("QB_URL", "http://127.0.0.1:8080")
 RSS_URL      = os.getenv("RSS_URL")
@@ -33,8 +40,10 @@ STATE_FILE   = os.getenv("STATE_FILE", "./ratiotest.state.json")
 INTERVAL_MIN = int(os.getenv("INTERVAL_MINUTES", "15"))
 LOG_FILE     = os.getenv("LOG_FILE", "./ratiotest.log")
 DOWNLOAD_SPEED_MBPS = float(os.getenv("DOWNLOAD_SPEED_MBPS", "10"))
+MAX_FEED_WAIT_MIN = int(os.getenv("MAX_FEED_WAIT_MINUTES", str(4 * INTERVAL_MIN)))
 
 FRESH_WINDOW = 10 * 60      # 10 min
+POLL_JITTER = 30            # s, spreads polls so restarts don't align on the server
 DEFAULT_COOLDOWN = 2 * 60 * 60  # 2 h fallback
 SPEED_BYTES_PER_SEC = max(DOWNLOAD_SPEED_MBPS, 0) * 1024 * 1024
 
@@ -43,47 +52,42 @@ if not RSS_URL:
     sys.exit(1)
 
 # ─── LOGGING ───────────────────────────────────────────────
-Path(LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
-logger = logging.getLogger("ratiotest")
-logger.setLevel(logging.INFO)
-fmt = logging.Formatter("%(asctime)s %(levelname)s: %(message)s")
+logger = setup_logger("ratiotest", LOG_FILE)
+STOP_EVENT = threading.Event()
 
-fh = logging.FileHandler(LOG_FILE)
-fh.setFormatter(fmt)
-logger.addHandler(fh)
+# ─── STATE HELPERS ─────────────────────────────────────────
+DEFAULT_STATE: Dict[str, Any] = {
+    "last_guid": None, "last_dl_ts": 0, "cooldown_until": 0, "etag": None, "modified": None,
+    "next_wake": 0,
+}
 
-sh = logging.StreamHandler(sys.stdout)
-sh.setFormatter(fmt)
-logger.addHandler(sh)
+_last_saved_hash: Optional[int] = None
 
-# ─── STATE HELPERS ─────────────────────────────────────────
-DEFAULT_STATE: Dict[str, Any] = {"last_guid": None, "last_dl_ts": 0, "cooldown_until": 0}
+def _state_hash(state: Dict[str, Any]) -> int:
+    return hash(json.dumps(state, sort_keys=True))
 
 def load_state(path: str) -> Dict[str, Any]:
+    global _last_saved_hash
     try:
-        return {**DEFAULT_STATE, **json.loads(Path(path).read_text())}
+        state = {**DEFAULT_STATE, **json.loads(Path(path).read_text())}
     except (FileNotFoundError, json.JSONDecodeError):
         return DEFAULT_STATE.copy()
+    _last_saved_hash = _state_hash(state)
+    return state
 
 def save_state(path: str, state: Dict[str, Any]):
-    Path(path).write_text(json.dumps(state, indent=2))
+    """Atomically write `state` (compact JSON), skipping the write if nothing changed."""
+    global _last_saved_hash
+    digest = _state_hash(state)
+    if digest == _last_saved_hash:
+        return
+    target = Path(path)
+    tmp = target.with_suffix(f"{target.suffix}.tmp")
+    tmp.write_text(json.dumps(state, separators=(",", ":")))
+    os.replace(tmp, target)
+    _last_saved_hash = digest
 
 # ─── UTILS ─────────────────────────────────────────────────
-def extract_torrent_size(entry) -> Optional[int]:
-    candidates = [
-        entry.get("contentlength"),
-        entry.get("torrent", {}).get("contentlength") if entry.get("torrent") else None,
-    ]
-    for raw in candidates:
-        if raw is None:
-            continue
-        try:
-            return int(raw)
-        except (TypeError, ValueError):
-            continue
-    return None
-
-
 def calculate_cooldown_seconds(entry) -> int:
     size_bytes = extract_torrent_size(entry)
     if size_bytes and SPEED_BYTES_PER_SEC > 0:
@@ -91,62 +95,9 @@ def calculate_cooldown_seconds(entry) -> int:
     return DEFAULT_COOLDOWN
 
 
-def bdecode(data: bytes, idx: int = 0):
-    token = data[idx:idx+1]
-    if not token:
-        raise ValueError("unexpected end of data")
-    if token == b"i":
-        end = data.index(b"e", idx)
-        return int(data[idx+1:end]), end + 1
-    if token == b"l":
-        idx += 1
-        out = []
-        while data[idx:idx+1] != b"e":
-            val, idx = bdecode(data, idx)
-            out.append(val)
-        return out, idx + 1
-    if token == b"d":
-        idx += 1
-        out = {}
-        while data[idx:idx+1] != b"e":
-            key, idx = bdecode(data, idx)
-            val, idx = bdecode(data, idx)
-            out[key] = val
-        return out, idx + 1
-    if token.isdigit():
-        colon = data.index(b":", idx)
-        length = int(data[idx:colon])
-        start = colon + 1
-        end = start + length
-        return data[start:end], end
-    raise ValueError(f"unexpected token at {idx}: {token!r}")
-
-
-def parse_torrent_size(torrent_bytes: bytes) -> Optional[int]:
-    try:
-        decoded, _ = bdecode(torrent_bytes, 0)
-    except Exception:
-        return None
-    if not isinstance(decoded, dict):
-        return None
-    info = decoded.get(b"info")
-    if not isinstance(info, dict):
-        return None
-    if b"length" in info and isinstance(info[b"length"], int):
-        return info[b"length"]
-    files = info.get(b"files")
-    if isinstance(files, list):
-        total = 0
-        for f in files:
-            if isinstance(f, dict) and isinstance(f.get(b"length"), int):
-                total += f[b"length"]
-        return total if total > 0 else None
-    return None
-
-
 def download_torrent(url: str) -> Optional[bytes]:
     try:
-        resp = requests.get(url, timeout=30)
+        resp = SESSION.get(url, timeout=30)
     except Exception as exc:
         logger.warning("RSS test: failed to fetch torrent (%s)", exc)
         return None
@@ -155,26 +106,42 @@ def download_torrent(url: str) -> Optional[bytes]:
         return None
     return resp.content
 
-def get_torrent_url(entry) -> Optional[str]:
-    for enc in entry.get("enclosures", []):
-        href = enc.get("href")
-        if href and ".torrent" in urlparse(href).path:
-            return href
-    for link in entry.get("links", []):
-        if link.get("type") in ("application/x-bittorrent", "application/octet-stream"):
-            return link.get("href")
-    link = entry.get("link")
-    return link if link and ".torrent" in urlparse(link).path else None
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+def server_wait_sec(resp) -> int:
+    """Seconds the feed asked us to stay away (Cache-Control max-age / Retry-After)."""
+    wait = 0
+    match = _MAX_AGE_RE.search(resp.headers.get("Cache-Control", ""))
+    if match:
+        wait = int(match.group(1))
+    retry_after = resp.headers.get("Retry-After", "").strip()
+    if retry_after.isdigit():
+        wait = max(wait, int(retry_after))
+    elif retry_after:
+        try:
+            wait = max(wait, int(parsedate_to_datetime(retry_after).timestamp() - time.time()))
+        except (TypeError, ValueError):
+            pass
+    if wait > MAX_FEED_WAIT_MIN * 60:
+        logger.info("RSS server asked for a %.1f min pause; capping at %d min", wait / 60, MAX_FEED_WAIT_MIN)
+        wait = MAX_FEED_WAIT_MIN * 60
+    return wait
+
+
+@functools.lru_cache(maxsize=64)
+def _utc_midnight(year: int, month: int, day: int) -> int:
+    return int(datetime(year, month, day, tzinfo=timezone.utc).timestamp())
 
 
-def get_entry_age_sec(entry) -> Optional[int]:
-    """Return age in seconds by converting struct_time to UTC epoch."""
+def get_entry_age_sec(entry, now: float) -> Optional[int]:
+    """Return age in seconds at `now` by converting struct_time to UTC epoch."""
     parsed = entry.get("published_parsed") or entry.get("updated_parsed")
     if not parsed:
         return None
-    # feedparser normalises parsed struct_time to UTC already → use calendar.timegm
-    entry_ts = calendar.timegm(parsed)
-    return int(time.time() - entry_ts)
+    # feedparser normalises parsed struct_time to UTC already; entries cluster on a few
+    # days, so the per-day epoch is cached and only the time of day is added per call
+    entry_ts = _utc_midnight(parsed[0], parsed[1], parsed[2]) + parsed[3] * 3600 + parsed[4] * 60 + parsed[5]
+    return int(now - entry_ts)
 
 # ─── CORE LOGIC ────────────────────────────────────────────
 
@@ -188,16 +155,45 @@ def run_once():
     # Rule 3: cooldown first
     if now < cooldown_until:
         remaining = (cooldown_until - now) // 60
-        logger.info(f"Rule‑3 cooldown active ({remaining} min left) → skip")
+        logger.info("Rule‑3 cooldown active (%d min left) → skip", remaining)
         return
 
-    feed = feedparser.parse(RSS_URL)
-    if not feed.entries:
-        logger.warning("RSS feed empty or unreachable")
+    # Honour a max-age / Retry-After from an earlier poll, even across restarts
+    if state["next_wake"] > now + MAX_FEED_WAIT_MIN * 60:  # saved before the cap applied
+        state["next_wake"] = now + MAX_FEED_WAIT_MIN * 60
+        save_state(STATE_FILE, state)
+    if now < state["next_wake"]:
+        logger.info("RSS server asked to wait (%d s left) → skip", state["next_wake"] - now)
         return
 
-    entry = feed.entries[0]
-    guid = entry.get("id") or entry.get("guid") or entry.get("link")
+    # Conditional GET: an unchanged feed costs a bodiless 304 instead of a full parse
+    try:
+        resp = conditional_get(RSS_URL, state.get("etag"), state.get("modified"))
+    except requests.RequestException as exc:
+        logger.warning("RSS feed unreachable (%s)", exc)
+        return
+    wait = server_wait_sec(resp)
+    if wait:
+        state["next_wake"] = now + wait
+        save_state(STATE_FILE, state)
+    if resp.status_code == 304:
+        logger.info("RSS feed not modified since last poll → skip")
+        return
+    if resp.status_code != 200:
+        logger.warning("RSS fetch status %s", resp.status_code)
+        return
+    etag, modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    if etag != state.get("etag") or modified != state.get("modified"):
+        state["etag"] = etag
+        state["modified"] = modified
+        save_state(STATE_FILE, state)
+
+    # Only the newest item matters – stream-parse up to it instead of the whole feed
+    entry = first_entry(resp.content)
+    if entry is None:
+        logger.warning("RSS feed empty or unreachable")
+        return
+    guid = get_guid(entry)
 
     # Rule 1: duplicate check
     if guid == last_guid:
@@ -205,9 +201,9 @@ def run_once():
         return
 
     # Rule 2: freshness
-    age_sec = get_entry_age_sec(entry)
+    age_sec = get_entry_age_sec(entry, now)
     if age_sec is None or age_sec > FRESH_WINDOW:
-        logger.info(f"Rule‑2: Torrent age is {age_sec/60:.1f} min > 10 min → skip")
+        logger.info("Rule‑2: Torrent age is %.1f min > 10 min → skip", age_sec / 60)
         return
 
     torrent_url = get_torrent_url(entry)
@@ -224,7 +220,7 @@ def run_once():
         logger.warning("RSS test: could not prefetch .torrent; size may be unknown")
     torrent_size_bytes = extract_torrent_size(entry)
     if torrent_size_bytes is None and torrent_bytes:
-        torrent_size_bytes = parse_torrent_size(torrent_bytes)
+        torrent_size_bytes = torrent_total_length(torrent_bytes)
 
     # Update state
     size_for_cooldown = torrent_size_bytes or extract_torrent_size(entry)
@@ -246,10 +242,29 @@ def run_once():
 
 # ─── MAIN LOOP ─────────────────────────────────────────────
 if __name__ == "__main__":
+    def _handle_signal(signum, frame):
+        logger.info("Received signal %s – shutting down", signum)
+        STOP_EVENT.set()
+
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+
     logger.info("Starting ratiotest (interval %d min)", INTERVAL_MIN)
-    while True:
+    next_tick = time.monotonic()
+    while not STOP_EVENT.is_set():
+        server_wait = 0.0
         try:
             run_once()
+            server_wait = load_state(STATE_FILE)["next_wake"] - time.time()
         except Exception as exc:
             logger.exception("Unexpected error: %s", exc)
-        time.sleep(INTERVAL_MIN * 60)
+        # Schedule from the previous tick (not from when run_once returned) so polls
+        # keep a fixed cadence, pushed back only when the server asked us to wait
+        next_tick += INTERVAL_MIN * 60
+        next_tick = max(next_tick, time.monotonic() + server_wait)
+        sleep_for = next_tick - time.monotonic()
+        if sleep_for < 0:
+            # Fell behind (e.g. a slow fetch) – resync rather than firing a burst of polls
+            next_tick = time.monotonic()
+            continue
+        STOP_EVENT.wait(sleep_for + random.uniform(0, POLL_JITTER))
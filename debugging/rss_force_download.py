@@ -3,16 +3,15 @@
 
 Useful for debugging qBittorrent responses without the RatioKing rule engine.
 """
-import logging
 import os
 import sys
-from pathlib import Path
-from typing import Optional
 
-import feedparser
-import requests
 from dotenv import load_dotenv
 
+from _common import get_guid, get_torrent_url, setup_logger
+from _feedcache import get_feed
+from _http import SESSION
+
 load_dotenv()
 
 QB_URL = os.getenv("QB_URL")
@@ -37,40 +36,19 @@ if missing:
     print(f"❌ Missing required env vars: {', '.join(missing)}")
     sys.exit(1)
 
-logger = logging.getLogger("rss_force_download")
-logger.setLevel(logging.INFO)
-handler = logging.StreamHandler(sys.stdout)
-handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
-logger.addHandler(handler)
-
-LOG_FILE = Path(os.getenv("FORCE_LOG_FILE", "./logs/rss_force_download.log"))
-LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-file_handler = logging.FileHandler(LOG_FILE)
-file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
-logger.addHandler(file_handler)
-
-
-def get_torrent_url(entry) -> Optional[str]:
-    for enclosure in entry.get("enclosures", []):
-        href = enclosure.get("href")
-        if href and href.endswith(".torrent"):
-            return href
-    for link in entry.get("links", []):
-        if link.get("type") in ("application/x-bittorrent", "application/octet-stream"):
-            return link.get("href")
-    link = entry.get("link")
-    return link if link and link.endswith(".torrent") else None
+LOG_FILE = os.getenv("FORCE_LOG_FILE", "./logs/rss_force_download.log")
+logger = setup_logger("rss_force_download", LOG_FILE)
 
 
 def main():
-    feed = feedparser.parse(RSS_URL)
+    feed = get_feed(RSS_URL)
     if not feed.entries:
         logger.error("⚠️ RSS feed empty or unreachable")
         sys.exit(2)
 
     entry = feed.entries[0]
     title = entry.get("title", "<no title>")
-    guid = entry.get("id") or entry.get("guid") or entry.get("link")
+    guid = get_guid(entry)
     torrent_url = get_torrent_url(entry)
     if not torrent_url:
         logger.error("❌ Could not find .torrent URL in feed entry")
@@ -80,8 +58,7 @@ def main():
     logger.info("GUID: %s", guid)
     logger.info("Torrent URL: %s", torrent_url)
 
-    session = requests.Session()
-    login = session.post(
+    login = SESSION.post(
         f"{QB_URL}/api/v2/auth/login",
         data={"username": QB_USER, "password": QB_PASS},
         headers={"Referer": QB_URL},
@@ -93,7 +70,7 @@ def main():
         sys.exit(4)
     logger.info("🔑 Authenticated to qBittorrent")
 
-    add = session.post(
+    add = SESSION.post(
         f"{QB_URL}/api/v2/torrents/add",
         data={
             "urls": torrent_url,
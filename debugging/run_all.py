@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""run_all.py – run several debugging scripts concurrently and print their reports in order.
+
+Every script is network-bound (feed fetch plus an optional .torrent download), so a
+small thread pool costs roughly the slowest script instead of the sum of all of them.
+Each script's stdout is buffered separately so the reports don't interleave.
+
+Usage: python run_all.py [script ...]
+Defaults to the read-only scripts; rss_force_download / telegram_* have side effects and
+only run when named explicitly. ratiotest is a long-running loop and is not supported here.
+"""
+import importlib
+import io
+import os
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from dotenv import load_dotenv
+
+from _feedcache import get_feed
+
+load_dotenv()
+
+RSS_URL = os.getenv("RSS_URL")
+MAX_WORKERS = 4
+DEFAULT_SCRIPTS = [
+    "cooldown_preview",
+    "rss_debug",
+    "rss_info_report",
+    "torrent_size_test",
+    "torrent_url_extractor_test",
+]
+
+if not RSS_URL:
+    print("❌ RSS_URL must be set (env or .env).")
+    sys.exit(1)
+
+
+class ThreadLocalStdout(io.TextIOBase):
+    """stdout replacement that sends each worker thread's writes to its own buffer."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        self._local.buf = io.StringIO()
+        return self._local.buf
+
+    def release(self):
+        self._local.buf = None
+
+    def write(self, text: str) -> int:
+        return (getattr(self._local, "buf", None) or self._fallback).write(text)
+
+    def flush(self):
+        self._fallback.flush()
+
+
+def run_script(stdout: ThreadLocalStdout, name: str) -> Tuple[str, int]:
+    buf = stdout.capture()
+    code = 0
+    try:
+        importlib.import_module(name).main()
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else 1
+    except Exception:
+        traceback.print_exc(file=buf)
+        code = 1
+    finally:
+        stdout.release()
+    return buf.getvalue(), code
+
+
+def main(names: List[str]) -> int:
+    real_stdout = sys.stdout
+    stdout = ThreadLocalStdout(real_stdout)
+    sys.stdout = stdout
+    try:
+        # Warm the shared feed cache once so the workers don't all fetch and parse it in parallel
+        get_feed(RSS_URL)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = [pool.submit(run_script, stdout, name) for name in names]
+            results = [f.result() for f in futures]
+    finally:
+        sys.stdout = real_stdout
+
+    failed = 0
+    for name, (output, code) in zip(names, results):
+        print(f"═══ {name} (exit {code}) ═══")
+        print(output.rstrip("\n"))
+        print()
+        failed += code != 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:] or DEFAULT_SCRIPTS))
@@ -5,11 +5,12 @@ Run this to verify your TELEGRAM_BOT_TOKEN / TELEGRAM_CHAT_ID are working withou
 """
 import os
 import sys
-import logging
-import html
 from dotenv import load_dotenv
-import feedparser
-import requests
+
+from _common import extract_torrent_size, setup_logger
+from _feedcache import get_feed
+from _fmt import human_bytes, maybe_escape
+from _http import SESSION
 
 load_dotenv()
 
@@ -17,18 +18,14 @@ RSS_URL = os.getenv("RSS_URL")
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 
-logger = logging.getLogger("telegram_test")
-logger.setLevel(logging.INFO)
-handler = logging.StreamHandler(sys.stdout)
-handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
-logger.addHandler(handler)
+logger = setup_logger("telegram_test")
 
 
 def notify_telegram(message: str):
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
         logger.error("❌ TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID must be set")
         sys.exit(2)
-    resp = requests.post(
+    resp = SESSION.post(
         f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage",
         data={"chat_id": TELEGRAM_CHAT_ID, "text": message, "parse_mode": "HTML"},
         timeout=10,
@@ -44,29 +41,17 @@ def main():
         logger.error("❌ RSS_URL must be set")
         sys.exit(1)
 
-    feed = feedparser.parse(RSS_URL)
+    feed = get_feed(RSS_URL)
     if not feed.entries:
         logger.error("⚠️ RSS feed empty or unreachable")
         sys.exit(4)
 
     entry = feed.entries[0]
     title = entry.get("title", "<no title>")
-    size_bytes = entry.get("contentlength")
-    size_text = "unknown size"
-    try:
-        if size_bytes:
-            size_int = int(size_bytes)
-            units = ["B", "KB", "MB", "GB", "TB", "PB"]
-            sz = float(size_int)
-            for unit in units:
-                if abs(sz) < 1024.0:
-                    size_text = f"{sz:.2f} {unit}"
-                    break
-                sz /= 1024.0
-    except Exception:
-        pass
+    size_bytes = extract_torrent_size(entry)
+    size_text = human_bytes(size_bytes) if size_bytes else "unknown size"
 
-    message = f"<b>📥 Added torrent</b>\n\n{html.escape(title)}\n\nSize: {size_text}"
+    message = f"<b>📥 Added torrent</b>\n\n{maybe_escape(title)}\n\nSize: {size_text}"
     logger.info("Latest RSS item: %s (size: %s)", title, size_text)
     notify_telegram(message)
 
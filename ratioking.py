@@ -8,14 +8,16 @@ import sys
 import json
 import time
 import logging
-import calendar
 import math
 import html
 import signal
 import threading
-from urllib.parse import urlparse
+import io
+import re
+import email.utils
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 try:
     from dotenv import load_dotenv
@@ -23,8 +25,32 @@ try:
 except ImportError:
     pass
 
-import feedparser
+try:
+    # Optional C bencode decoder; the pure-Python bdecode below is the fallback
+    from fastbencode import bdecode as _fast_bdecode
+except ImportError:
+    _fast_bdecode = None
+
+try:
+    # Optional faster JSON for the state file; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ratioking_hot import (
+    decode_info,
+    extract_torrent_size,
+    get_entry_age_sec,
+    get_torrent_url,
+    info_total_length,
+)
+
+# Bound once: read on every poll
+_now = time.time
 
 # ─── CONFIG ────────────────────────────────────────────────
 QB_URL       = os.getenv("QB_URL", "http://127.0.0.1:8080")
@@ -40,6 +66,9 @@ TELEGRAM_CHAT_ID   = os.getenv("TELEGRAM_CHAT_ID")
 HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "20"))
 MAX_TORRENT_BYTES = int(os.getenv("MAX_TORRENT_BYTES", str(5 * 1024 * 1024)))
 USER_AGENT = os.getenv("USER_AGENT", "ratioking/1.0")
+# Upper bound on a feed-requested pause, so a long max-age can't silently skip releases
+MAX_FEED_WAIT_MIN = int(os.getenv("MAX_FEED_WAIT_MINUTES", str(4 * INTERVAL_MIN)))
+FEED_ACCEPT = "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8"
 
 # 🎯 User-tunable download parameters
 SAVE_PATH            = os.getenv("SAVE_PATH", "/mnt/ratioking/avistaz")
@@ -49,6 +78,7 @@ RATIO_LIMIT          = float(os.getenv("RATIO_LIMIT", "-1"))   # -1 = unlimited
 SEEDING_TIME_LIMIT   = int(os.getenv("SEEDING_TIME_LIMIT", "-1"))  # -1 = unlimited
 
 FRESH_WINDOW = 10 * 60      # 10 min
+FRESH_WINDOW_MIN = FRESH_WINDOW / 60
 DEFAULT_COOLDOWN = 2 * 60 * 60  # 2 h fallback
 SPEED_BYTES_PER_SEC = max(DOWNLOAD_SPEED_MBPS, 0) * 1024 * 1024
 
@@ -78,117 +108,118 @@ handlers.append(sh)
 for h in handlers:
     logger.addHandler(h)
 
+# Accept-Encoding is left to requests' default, which already offers gzip/deflate (and br
+# when Brotli is installed). urllib3 would otherwise retry any 413/429/503 carrying
+# Retry-After and sleep through it uninterruptibly; the poll loop honours it instead.
 HTTP_SESSION = requests.Session()
 HTTP_SESSION.headers.update({"User-Agent": USER_AGENT})
+_http_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 504], raise_on_status=False,
+                      respect_retry_after_header=False),
+)
+HTTP_SESSION.mount("http://", _http_adapter)
+HTTP_SESSION.mount("https://", _http_adapter)
+
+# Kept for the whole process so the qBittorrent connection and SID cookie are reused.
+# Referer (required by qBittorrent's CSRF check) is set once here; requests already
+# sends Connection: keep-alive by default.
+QB_SESSION = requests.Session()
+QB_SESSION.headers.update({"User-Agent": USER_AGENT, "Referer": QB_URL})
+_qb_adapter = HTTPAdapter(pool_maxsize=4, max_retries=Retry(total=2, backoff_factor=0.3))
+QB_SESSION.mount("http://", _qb_adapter)
+QB_SESSION.mount("https://", _qb_adapter)
+_QB_LOGIN_URL = f"{QB_URL}/api/v2/auth/login"
+_QB_ADD_URL = f"{QB_URL}/api/v2/torrents/add"
+_QB_OK = frozenset({"Ok.", "Ok"})  # torrents/add success bodies across qBittorrent versions
+
+TG_SESSION = requests.Session()
+TG_SESSION.headers.update({"User-Agent": USER_AGENT})
+_TG_URL = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+
 STOP_EVENT = threading.Event()
 
 # ─── STATE ─────────────────────────────────────────────────
-DEFAULT_STATE: Dict[str, Any] = {"last_guid": None, "last_dl_ts": 0, "cooldown_until": 0}
+DEFAULT_STATE: Dict[str, Any] = {
+    "last_guid": None,
+    "last_dl_ts": 0,
+    "cooldown_until": 0,
+    "feed_etag": None,       # validators of the last feed body a decision was made on
+    "feed_modified": None,
+}
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _dump_state(state: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(state)
+    return json.dumps(state, separators=(",", ":")).encode()
+
+# Last state read or written, keyed by the file's mtime so unchanged files aren't re-parsed
+_STATE_CACHE: Dict[str, Any] = {"mtime": -1, "data": None}
 
 def load_state(path: str) -> Dict[str, Any]:
     try:
-        data = json.loads(Path(path).read_text())
-        return {**DEFAULT_STATE, **data}
+        mtime = os.stat(path).st_mtime_ns
+        if mtime == _STATE_CACHE["mtime"]:
+            return dict(_STATE_CACHE["data"])
+        data = _json_loads(Path(path).read_bytes())
     except FileNotFoundError:
         return DEFAULT_STATE.copy()
     except json.JSONDecodeError as exc:
         logger.warning("⚠️ State file corrupt (%s); resetting to defaults", exc)
         return DEFAULT_STATE.copy()
+    state = {**DEFAULT_STATE, **data}
+    _STATE_CACHE.update(mtime=mtime, data=state)
+    return dict(state)
 
 def save_state(path: str, state: Dict[str, Any]):
+    # Nothing to write if this is exactly what the file on disk already holds
+    if state == _STATE_CACHE["data"]:
+        try:
+            if os.stat(path).st_mtime_ns == _STATE_CACHE["mtime"]:
+                return
+        except FileNotFoundError:
+            pass
     target = Path(path)
-    payload = json.dumps(state, indent=2)
     tmp = target.with_suffix(f"{target.suffix}.tmp")
-    tmp.write_text(payload)
+    tmp.write_bytes(_dump_state(state))
     tmp.replace(target)
+    _STATE_CACHE.update(mtime=os.stat(target).st_mtime_ns, data=dict(state))
 
 # ─── HELPERS ───────────────────────────────────────────────
-def extract_torrent_size(entry) -> Optional[int]:
-    """Return content size in bytes, if present in feed entry."""
-    candidates = [
-        entry.get("contentlength"),
-        entry.get("torrent", {}).get("contentlength") if entry.get("torrent") else None,
-    ]
-    for raw in candidates:
-        if raw is None:
-            continue
-        try:
-            return int(raw)
-        except (TypeError, ValueError):
-            continue
-    return None
-
-
-def calculate_cooldown_seconds(entry) -> int:
-    size_bytes = extract_torrent_size(entry)
+def calculate_cooldown_seconds(size_bytes: Optional[int]) -> int:
     if size_bytes and SPEED_BYTES_PER_SEC > 0:
         seconds = math.ceil(size_bytes / SPEED_BYTES_PER_SEC)
         return max(seconds, 0)
     return DEFAULT_COOLDOWN
 
 
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+
 def human_bytes(num: int) -> str:
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    size = float(num)
-    for unit in units:
-        if abs(size) < 1024.0:
-            return f"{size:.2f} {unit}"
-        size /= 1024.0
-    return f"{size:.2f} EB"
-
-
-def bdecode(data: bytes, idx: int = 0):
-    """Minimal bencode decoder for .torrent metadata."""
-    token = data[idx:idx+1]
-    if not token:
-        raise ValueError("unexpected end of data")
-    if token == b"i":
-        end = data.index(b"e", idx)
-        return int(data[idx+1:end]), end + 1
-    if token == b"l":
-        idx += 1
-        out = []
-        while data[idx:idx+1] != b"e":
-            val, idx = bdecode(data, idx)
-            out.append(val)
-        return out, idx + 1
-    if token == b"d":
-        idx += 1
-        out = {}
-        while data[idx:idx+1] != b"e":
-            key, idx = bdecode(data, idx)
-            val, idx = bdecode(data, idx)
-            out[key] = val
-        return out, idx + 1
-    if token.isdigit():
-        colon = data.index(b":", idx)
-        length = int(data[idx:colon])
-        start = colon + 1
-        end = start + length
-        return data[start:end], end
-    raise ValueError(f"unexpected token at {idx}: {token!r}")
+    if num <= 0:
+        return "0.00 B"
+    # bit_length picks the 1024-power directly instead of dividing in a loop
+    idx = min((num.bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{num / (1 << (10 * idx)):.2f} {_UNITS[idx]}"
 
 
 def parse_torrent_size(torrent_bytes: bytes) -> Optional[int]:
     try:
-        decoded, _ = bdecode(torrent_bytes, 0)
+        if _fast_bdecode is not None:
+            try:
+                decoded = _fast_bdecode(torrent_bytes)
+            except ValueError:
+                # fastbencode rejects trailing bytes after the top-level dict; decode_info doesn't
+                decoded = {b"info": decode_info(torrent_bytes)}
+            info = decoded.get(b"info") if isinstance(decoded, dict) else None
+        else:
+            info = decode_info(torrent_bytes)
     except Exception:
         return None
-    if not isinstance(decoded, dict):
-        return None
-    info = decoded.get(b"info")
-    if not isinstance(info, dict):
-        return None
-    if b"length" in info and isinstance(info[b"length"], int):
-        return info[b"length"]
-    files = info.get(b"files")
-    if isinstance(files, list):
-        total = 0
-        for f in files:
-            if isinstance(f, dict) and isinstance(f.get(b"length"), int):
-                total += f[b"length"]
-        return total if total > 0 else None
-    return None
+    return info_total_length(info)
 
 
 def download_torrent(url: str) -> Optional[bytes]:
@@ -217,8 +248,8 @@ def notify_telegram(message: str):
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
         return
     try:
-        resp = requests.post(
-            f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage",
+        resp = TG_SESSION.post(
+            _TG_URL,
             data={"chat_id": TELEGRAM_CHAT_ID, "text": message, "parse_mode": "HTML"},
             timeout=10,
         )
@@ -227,39 +258,165 @@ def notify_telegram(message: str):
     except Exception as exc:
         logger.warning("⚠️ Telegram notify raised %s", exc)
 
-def fetch_feed(url: str):
+def _qb_has_sid() -> bool:
+    # qBittorrent 5 names the cookie QBT_SID_<port>; older releases use plain SID
+    return any(c.name == "SID" or c.name.startswith("QBT_SID") for c in QB_SESSION.cookies)
+
+
+def qb_login() -> bool:
+    """Log in to qBittorrent unless QB_SESSION already holds a session cookie."""
+    if _qb_has_sid():
+        return True
+    login = QB_SESSION.post(
+        _QB_LOGIN_URL,
+        data={"username": QB_USER, "password": QB_PASS},
+        timeout=10)
+    login_body = login.text.strip()
+    if login.status_code != 200 or login_body != "Ok.":
+        logger.error("❌ qBittorrent login failed – status %s body %r", login.status_code, login_body)
+        return False
+    logger.info("🔑 Authenticated to qBittorrent")
+    return True
+
+
+def qb_add_torrent(data: Dict[str, Any], files) -> Optional[requests.Response]:
+    """POST torrents/add, logging in again once if the stored session has expired."""
+    if not qb_login():
+        return None
+    add = QB_SESSION.post(_QB_ADD_URL, data=data, files=files, timeout=20)
+    if add.status_code == 403:
+        logger.info("🔑 qBittorrent session expired – logging in again")
+        QB_SESSION.cookies.clear()
+        if not qb_login():
+            return None
+        add = QB_SESSION.post(_QB_ADD_URL, data=data, files=files, timeout=20)
+    return add
+
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Epoch before which the feed server asked not to be polled again (Cache-Control
+# max-age / Retry-After). Process-local: after a restart the first poll just refreshes it.
+_feed_not_before = 0.0
+
+def server_wait_sec(resp: requests.Response) -> int:
+    """Seconds the feed asked us to stay away (Cache-Control max-age / Retry-After)."""
+    wait = 0
+    match = _MAX_AGE_RE.search(resp.headers.get("Cache-Control", ""))
+    if match:
+        wait = int(match.group(1))
+    retry_after = resp.headers.get("Retry-After", "").strip()
+    if retry_after.isdigit():
+        wait = max(wait, int(retry_after))
+    elif retry_after:
+        try:
+            wait = max(wait, int(email.utils.parsedate_to_datetime(retry_after).timestamp() - _now()))
+        except (TypeError, ValueError):
+            pass
+    if wait > MAX_FEED_WAIT_MIN * 60:
+        logger.info("🗓️ Feed asked for a %.1f min pause; capping at %d min", wait / 60, MAX_FEED_WAIT_MIN)
+        wait = MAX_FEED_WAIT_MIN * 60
+    return wait
+
+
+# Returned by fetch_latest_entry when the server answers 304 Not Modified
+_NOT_MODIFIED = object()
+
+
+def parse_first_item(xml_bytes: bytes) -> Optional[Dict[str, Any]]:
+    """Map the first <item> of an RSS 2.0 feed to feedparser's entry keys.
+
+    Parsing stops at that item. Returns None for anything that isn't plain RSS 2.0
+    with an RFC 822 pubDate, so the caller can fall back to feedparser.
+    """
+    context = ET.iterparse(io.BytesIO(xml_bytes), events=("start", "end"))
+    _, root = next(context)
+    if root.tag != "rss":
+        return None
+    for event, elem in context:
+        if event != "end" or elem.tag != "item":
+            continue
+        entry: Dict[str, Any] = {"enclosures": [], "links": []}
+        for child in elem:
+            name = child.tag
+            text = (child.text or "").strip()
+            if name == "title":
+                entry["title"] = text
+            elif name == "guid" and text:
+                entry["id"] = text
+            elif name == "link" and text:
+                entry["link"] = text
+                entry["links"].append({"rel": "alternate", "type": "text/html", "href": text})
+            elif name == "pubDate" and text:
+                entry["published"] = text
+            elif name == "enclosure":
+                enc = {"href": child.get("url"), "length": child.get("length"), "type": child.get("type")}
+                entry["enclosures"].append(enc)
+                entry["links"].append({"rel": "enclosure", **enc})
+            elif name.lower() == "contentlength" and text:  # un-namespaced only, as feedparser
+                entry["contentlength"] = text
+        try:
+            email.utils.parsedate_to_datetime(entry["published"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return entry
+    return None
+
+
+def first_entry(xml_bytes: bytes):
+    """Return the newest entry of the feed, or None if it has none."""
     try:
-        resp = HTTP_SESSION.get(url, timeout=HTTP_TIMEOUT)
+        entry = parse_first_item(xml_bytes)
+    except ET.ParseError:
+        entry = None
+    if entry is not None:
+        return entry
+    # Atom, RSS 1.0, malformed XML or odd dates: let feedparser deal with it. Imported
+    # here so plain RSS 2.0 feeds (the usual case) never pay its import time and memory.
+    import feedparser
+    feed = feedparser.parse(xml_bytes)
+    if getattr(feed, "bozo", False):
+        logger.warning("⚠️ RSS parse issue: %s", getattr(feed, "bozo_exception", "unknown"))
+    return feed.entries[0] if feed.entries else None
+
+
+def fetch_latest_entry(url: str, state: Dict[str, Any]):
+    """Fetch the feed, sending the validators stored in `state`, and return its newest entry.
+
+    Records the new ETag / Last-Modified in `state` on a 200. Returns _NOT_MODIFIED on
+    a 304, None if the feed is unreachable or empty.
+    """
+    headers = {"Accept": FEED_ACCEPT}
+    if state.get("feed_etag"):
+        headers["If-None-Match"] = state["feed_etag"]
+    if state.get("feed_modified"):
+        headers["If-Modified-Since"] = state["feed_modified"]
+    try:
+        resp = HTTP_SESSION.get(url, headers=headers, timeout=HTTP_TIMEOUT)
     except Exception as exc:
         logger.warning("⚠️ Failed to fetch RSS feed (%s)", exc)
         return None
+    wait = server_wait_sec(resp)
+    if wait > 0:
+        global _feed_not_before
+        _feed_not_before = _now() + wait
+    if resp.status_code == 304:
+        return _NOT_MODIFIED
     if resp.status_code != 200:
         logger.warning("⚠️ RSS fetch status %s", resp.status_code)
         return None
-    feed = feedparser.parse(resp.content)
-    if getattr(feed, "bozo", False):
-        logger.warning("⚠️ RSS parse issue: %s", getattr(feed, "bozo_exception", "unknown"))
-    return feed
+    state["feed_etag"] = resp.headers.get("ETag")
+    state["feed_modified"] = resp.headers.get("Last-Modified")
+    return first_entry(resp.content)
 
-def _is_allowed_scheme(url: str) -> bool:
-    return urlparse(url).scheme in {"http", "https"}
 
-def get_torrent_url(entry) -> Optional[str]:
-    for enc in entry.get("enclosures", []):
-        href = enc.get("href")
-        if href and ".torrent" in urlparse(href).path and _is_allowed_scheme(href):
-            return href
-    for link in entry.get("links", []):
-        href = link.get("href")
-        if href and link.get("type") in ("application/x-bittorrent", "application/octet-stream") and _is_allowed_scheme(href):
-            return href
-    link = entry.get("link")
-    return link if link and ".torrent" in urlparse(link).path and _is_allowed_scheme(link) else None
+def save_feed_validators(state: Dict[str, Any], previous: Tuple[Optional[str], Optional[str]]):
+    """Persist new feed validators after a skip that would repeat for the same feed body.
 
-
-def get_entry_age_sec(entry) -> Optional[int]:
-    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
-    return None if not parsed else int(time.time() - calendar.timegm(parsed))
+    Failed adds deliberately don't call this, so the next poll re-fetches and retries.
+    """
+    if (state["feed_etag"], state["feed_modified"]) != previous:
+        save_state(STATE_FILE, state)
 
 # ─── CORE ─────────────────────────────────────────────────
 
@@ -268,63 +425,65 @@ def run_once():
     last_guid = state["last_guid"]
     last_dl_ts = state["last_dl_ts"]
     cooldown_until = state.get("cooldown_until", last_dl_ts + DEFAULT_COOLDOWN)
-    now = int(time.time())
+    now = int(_now())
 
     # Rule-3 ⏳ Cooldown
     if now < cooldown_until:
         remaining = (cooldown_until - now) // 60
-        logger.info(f"⏳ Cooldown active – {remaining} min left → skip")
+        logger.info("⏳ Cooldown active – %d min left → skip", remaining)
+        return
+    if now < _feed_not_before:
+        logger.info("🗓️ Feed asked not to be polled for %.1f min → skip", (_feed_not_before - now) / 60)
         return
 
-    feed = fetch_feed(RSS_URL)
-    if not feed or not feed.entries:
+    validators = (state["feed_etag"], state["feed_modified"])
+    entry = fetch_latest_entry(RSS_URL, state)
+    if entry is _NOT_MODIFIED:
+        logger.info("📭 RSS feed not modified since last poll → skip")
+        return
+    if entry is None:
         logger.warning("⚠️ RSS feed empty or unreachable")
         return
 
-    entry = feed.entries[0]
     guid = entry.get("id") or entry.get("guid") or entry.get("link")
 
     # Rule-1 🆔 Duplicate
     if guid == last_guid:
         logger.info("🆔 Latest GUID already processed → skip")
+        save_feed_validators(state, validators)
         return
 
     # Rule-2 ⏱️ Freshness
-    age_sec = get_entry_age_sec(entry)
+    age_sec = get_entry_age_sec(entry, now)
     if age_sec is None:
         logger.info("⏱️ Entry age unknown → skip")
+        save_feed_validators(state, validators)
         return
     if age_sec > FRESH_WINDOW:
-        logger.info("⏱️ Age %.1f min > %.1f min → skip", age_sec / 60, FRESH_WINDOW / 60)
+        logger.info("⏱️ Age %.1f min > %.1f min → skip", age_sec / 60, FRESH_WINDOW_MIN)
+        save_feed_validators(state, validators)
         return
 
     torrent_url = get_torrent_url(entry)
     if not torrent_url:
         logger.error("❌ .torrent URL not found → skip")
+        save_feed_validators(state, validators)
         return
 
-    torrent_bytes = download_torrent(torrent_url)
-    if not torrent_bytes:
-        logger.warning("⚠️ Could not prefetch .torrent; proceeding without size info")
-
-    torrent_size_bytes = extract_torrent_size(entry)
-    if torrent_size_bytes is None and torrent_bytes:
-        torrent_size_bytes = parse_torrent_size(torrent_bytes)
+    # Resolved once; cooldown, log line and notification all reuse it. The .torrent is
+    # only prefetched when the feed lacks the size – otherwise qBittorrent fetches the URL.
+    size_bytes = extract_torrent_size(entry)
+    torrent_bytes = None
+    if size_bytes is None:
+        torrent_bytes = download_torrent(torrent_url)
+        if torrent_bytes:
+            size_bytes = parse_torrent_size(torrent_bytes)
+        else:
+            logger.warning("⚠️ Could not prefetch .torrent; proceeding without size info")
 
     # All rules passed – download
     logger.info("✅ Downloading: %s", entry.get("title", "<no title>"))
 
-    session = requests.Session()
-    login = session.post(
-        f"{QB_URL}/api/v2/auth/login",
-        data={"username": QB_USER, "password": QB_PASS},
-        headers={"Referer": QB_URL}, timeout=10)
-    login_body = login.text.strip()
-    if login.status_code != 200 or login_body != "Ok.":
-        logger.error("❌ qBittorrent login failed – status %s body %r", login.status_code, login_body)
-        return
-    logger.info("🔑 Authenticated to qBittorrent")
-
     data = {
         "savepath": SAVE_PATH,
         "category": CATEGORY,
@@ -338,20 +497,14 @@ def run_once():
     else:
         data["urls"] = torrent_url
 
-    add = session.post(
-        f"{QB_URL}/api/v2/torrents/add",
-        data=data,
-        files=files,
-        headers={"Referer": QB_URL}, timeout=20)
+    add = qb_add_torrent(data, files)
+    if add is None:
+        return
 
     add_body = (add.text or "").strip()
-    if add.status_code == 200 and add_body in ("Ok.", "Ok"):
+    if add.status_code == 200 and add_body in _QB_OK:
         logger.info("📥 Torrent added successfully!")
-        size_for_cooldown = torrent_size_bytes or extract_torrent_size(entry)
-        if size_for_cooldown and SPEED_BYTES_PER_SEC > 0:
-            cooldown_seconds = math.ceil(size_for_cooldown / SPEED_BYTES_PER_SEC)
-        else:
-            cooldown_seconds = DEFAULT_COOLDOWN
+        cooldown_seconds = calculate_cooldown_seconds(size_bytes)
         cooldown_minutes = cooldown_seconds / 60
         state["last_guid"] = guid
         state["last_dl_ts"] = now
@@ -360,25 +513,34 @@ def run_once():
         if cooldown_seconds == DEFAULT_COOLDOWN:
             logger.info("💾 State saved – fallback cooldown %.1f min", DEFAULT_COOLDOWN / 60)
         else:
-            size_bytes = size_for_cooldown or 0
             size_gb = size_bytes / (1024 ** 3)
             logger.info("💾 State saved – cooldown %.1f min for %.2f GB @ %.2f MB/s",
                         cooldown_minutes, size_gb, DOWNLOAD_SPEED_MBPS)
-        size_bytes_msg = extract_torrent_size(entry)
-        if not size_bytes_msg:
-            size_bytes_msg = torrent_size_bytes
-        size_text = human_bytes(size_bytes_msg) if size_bytes_msg else "unknown size"
-        title = html.escape(entry.get("title", "<no title>"))
-        notify_telegram(
-            f"<b>📥 Added torrent</b>\n\n"
-            f"{title}\n\n"
-            f"Size: {size_text}\n"
-            f"Cooldown: {cooldown_minutes:.1f} min\n"
-            f"Ends: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now + cooldown_seconds))}"
-        )
+        if TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID:
+            size_text = human_bytes(size_bytes) if size_bytes else "unknown size"
+            title = html.escape(entry.get("title", "<no title>"))
+            notify_telegram(
+                f"<b>📥 Added torrent</b>\n\n"
+                f"{title}\n\n"
+                f"Size: {size_text}\n"
+                f"Cooldown: {cooldown_minutes:.1f} min\n"
+                f"Ends: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now + cooldown_seconds))}"
+            )
     else:
         logger.error("❌ Failed to add torrent – status %s body %r", add.status_code, add_body)
 
+def next_poll_delay() -> float:
+    """Seconds until the next poll: the interval, or longer during a cooldown or a server-requested pause."""
+    interval = INTERVAL_MIN * 60
+    cooldown_until = load_state(STATE_FILE)["cooldown_until"]
+    # +1 s so an early wake-up can't land just short of the deadline and skip a whole interval
+    remaining = max(cooldown_until, _feed_not_before) - _now() + 1
+    if remaining > interval:
+        reason = "Cooldown active" if cooldown_until >= _feed_not_before else "Feed asked for a pause"
+        logger.info("💤 %s – next poll in %.1f min", reason, remaining / 60)
+        return remaining
+    return interval
+
 # ─── ENTRY POINT ──────────────────────────────────────────
 if __name__ == "__main__":
     def _handle_signal(signum, frame):
@@ -392,6 +554,8 @@ if __name__ == "__main__":
     while not STOP_EVENT.is_set():
         try:
             run_once()
+            delay = next_poll_delay()
         except Exception as exc:
             logger.exception("💥 Unexpected error: %s", exc)
-        STOP_EVENT.wait(INTERVAL_MIN * 60)
+            delay = INTERVAL_MIN * 60
+        STOP_EVENT.wait(delay)
@@ -0,0 +1,193 @@
+"""ratioking_hot.py – pure helpers on ratioking's per-poll path.
+
+Everything here is fully annotated and free of I/O, logging and configuration, so the
+module can be compiled ahead of time with mypyc (`mypyc ratioking_hot.py`). The
+compiled extension is picked up by `import ratioking_hot` automatically; without it
+the module simply runs as plain Python.
+"""
+import calendar
+import email.utils
+import re
+from datetime import timezone
+from typing import Any, List, Mapping, Optional, Tuple
+
+# http(s) URL whose path (not host, query or fragment) contains ".torrent"
+_TORRENT_URL_RE = re.compile(r"(?i:https?)://[^/?#]*/[^?#]*\.torrent")
+
+_TORRENT_LINK_TYPES = frozenset({"application/x-bittorrent", "application/octet-stream"})
+
+_D, _L, _I, _E = b"dlie"
+_K_INFO = b"info"
+_K_LENGTH = b"length"
+_K_FILES = b"files"
+_K_PIECES = b"pieces"
+
+
+def bdecode(data: bytes, idx: int = 0) -> Tuple[Any, int]:
+    """Minimal bencode decoder for .torrent metadata.
+
+    Iterative, so nesting depth never touches the recursion limit. Values under a
+    `pieces` key (20 bytes per piece, never needed here) are skipped, not copied.
+    """
+    containers: List[Any] = []  # lists / dicts still being filled, innermost last
+    keys: List[Any] = []        # per container: pending dict key, None when expecting one
+    size = len(data)
+    while True:
+        if idx >= size:
+            raise ValueError("unexpected end of data")
+        token = data[idx]
+        if token == _D or token == _L:
+            containers.append({} if token == _D else [])
+            keys.append(None)
+            idx += 1
+            continue
+        if token == _E:
+            if not containers or keys.pop() is not None:
+                raise ValueError(f"unexpected end marker at {idx}")
+            value = containers.pop()
+            idx += 1
+        elif token == _I:
+            end = data.find(b"e", idx)
+            if end < 0:
+                raise ValueError("unterminated integer")
+            value = int(data[idx+1:end])
+            idx = end + 1
+        elif 48 <= token <= 57:  # ASCII digit: <length>:<bytes>
+            colon = data.find(b":", idx)
+            if colon < 0:
+                raise ValueError("unterminated string length")
+            start = colon + 1
+            idx = start + int(data[idx:colon])
+            if idx > size:
+                raise ValueError("unexpected end of data")
+            value = None if keys and keys[-1] == _K_PIECES else data[start:idx]
+        else:
+            raise ValueError(f"unexpected token at {idx}: {data[idx:idx+1]!r}")
+
+        if not containers:
+            return value, idx
+        parent = containers[-1]
+        if isinstance(parent, list):
+            parent.append(value)
+        elif keys[-1] is None:
+            keys[-1] = value
+        else:
+            if keys[-1] != _K_PIECES:
+                parent[keys[-1]] = value
+            keys[-1] = None
+
+
+def _skip(data: bytes, idx: int) -> int:
+    """Return the offset just past the bencoded value starting at `idx`, without decoding it."""
+    depth = 0
+    while True:
+        token = data[idx]
+        if token == _D or token == _L:
+            depth += 1
+            idx += 1
+            continue
+        if token == _E:
+            depth -= 1
+            idx += 1
+        elif token == _I:
+            end = data.find(b"e", idx)
+            if end < 0:
+                raise ValueError("unterminated integer")
+            idx = end + 1
+        elif 48 <= token <= 57:
+            colon = data.find(b":", idx)
+            if colon < 0:
+                raise ValueError("unterminated string length")
+            idx = colon + 1 + int(data[idx:colon])
+        else:
+            raise ValueError(f"unexpected token at {idx}: {data[idx:idx+1]!r}")
+        if depth <= 0:
+            return idx
+
+
+def decode_info(torrent_bytes: bytes) -> Any:
+    """Return the decoded `info` dict of a .torrent, or None."""
+    # Only info is needed, so walk the top-level keys and skip the other values undecoded
+    try:
+        if torrent_bytes[0] != _D:
+            return None
+        idx = 1
+        while torrent_bytes[idx] != _E:
+            key, idx = bdecode(torrent_bytes, idx)
+            if key == _K_INFO:
+                info, _ = bdecode(torrent_bytes, idx)
+                return info if isinstance(info, dict) else None
+            idx = _skip(torrent_bytes, idx)
+    except IndexError:
+        raise ValueError("unexpected end of data") from None
+    return None
+
+
+def info_total_length(info: Any) -> Optional[int]:
+    """Return the content size declared by a decoded `info` dict, or None."""
+    if not isinstance(info, dict):
+        return None
+    length = info.get(_K_LENGTH)
+    if isinstance(length, int):
+        return length
+    files = info.get(_K_FILES)
+    if isinstance(files, list):
+        total = 0
+        for f in files:
+            if isinstance(f, dict) and isinstance(f.get(_K_LENGTH), int):
+                total += f[_K_LENGTH]
+        return total if total > 0 else None
+    return None
+
+
+def extract_torrent_size(entry: Mapping[str, Any]) -> Optional[int]:
+    """Return content size in bytes, if present in feed entry."""
+    candidates = [
+        entry.get("contentlength"),
+        entry.get("torrent", {}).get("contentlength") if entry.get("torrent") else None,
+    ]
+    for raw in candidates:
+        if raw is None:
+            continue
+        try:
+            return int(raw)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def is_http(url: str) -> bool:
+    return url[:8].lower().startswith(("http://", "https://"))
+
+
+def looks_like_torrent(url: str) -> bool:
+    return _TORRENT_URL_RE.match(url) is not None
+
+
+def get_torrent_url(entry: Mapping[str, Any]) -> Optional[str]:
+    for enc in entry.get("enclosures", []):
+        href = enc.get("href")
+        if href and looks_like_torrent(href):
+            return href
+    for link in entry.get("links", []):
+        href = link.get("href")
+        if href and link.get("type") in _TORRENT_LINK_TYPES and is_http(href):
+            return href
+    link = entry.get("link")
+    return link if link and looks_like_torrent(link) else None
+
+
+def get_entry_age_sec(entry: Mapping[str, Any], now: float) -> Optional[int]:
+    # RSS 2.0 dates are RFC 822, so try the stdlib parser on the raw string first
+    raw = entry.get("published") or entry.get("updated")
+    if raw:
+        try:
+            published = email.utils.parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if published.tzinfo is None:  # "-0000" means UTC with unknown local zone
+                published = published.replace(tzinfo=timezone.utc)
+            return int(now - published.timestamp())
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    return None if not parsed else int(now - calendar.timegm(parsed))